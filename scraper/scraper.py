@@ -10,21 +10,39 @@ detect whether a PR is needed.
 """
 
 import argparse
+import asyncio
 import calendar
+import hashlib
 import json
 import logging
 import os
+import random
 import re
+import shutil
 import sys
+import threading
 import time
 import warnings
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import diskcache
 import feedparser
-import requests
+import httpx
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import orjson  # optional: much faster (de)serialisation of the data files
+except ImportError:
+    orjson = None
 
 # Suppress google-generativeai deprecation noise
 warnings.filterwarnings("ignore")
@@ -35,6 +53,9 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 log = logging.getLogger(__name__)
+# httpx logs every request at INFO (and h2 frames at DEBUG); keep the run log readable
+for _noisy in ("httpx", "httpcore", "hpack"):
+    logging.getLogger(_noisy).setLevel(logging.WARNING)
 
 # ---------------------------------------------------------------------------
 # Paths (resolved relative to this file, which sits next to the repo root)
@@ -43,76 +64,339 @@ REPO_ROOT = Path(__file__).parent.parent
 UNITS_FILE = REPO_ROOT / "data" / "units.json"
 EDGES_FILE = REPO_ROOT / "data" / "edges.json"
 FEEDS_FILE = Path(__file__).parent / "feeds.txt"
+CACHE_DIR = REPO_ROOT / ".cache" / "scraper"  # persisted between CI runs by actions/cache
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 FETCH_TIMEOUT = 15          # seconds for raw HTML requests
+FEED_TIMEOUT = 30           # seconds for a whole feed download, however slowly it trickles
 JINA_TIMEOUT = 30           # seconds for Jina Reader (headless browser, needs more time)
+PLASMATE_TIMEOUT = 20       # seconds for the optional local `plasmate fetch` extractor
 GROQ_MODEL = "llama-3.3-70b-versatile"
 GROQ_RPM = 25               # free tier allows 30 RPM; stay a little under
+GROQ_BURST = 5              # calls allowed back-to-back before RPM pacing kicks in
 GEMINI_MODEL = "gemini-2.5-flash"
-GEMINI_RPM = 5              # free-tier requests per minute; enforced with sleep
+GEMINI_RPM = 5              # free-tier requests per minute; enforced by GEMINI_LIMITER
+GEMINI_BURST = 1            # RPM is too low to spare any burst
+GEMINI_CACHE_MIN_CHARS = 4 * 2048  # explicit context caching needs ~2,048+ tokens
+GEMINI_CACHE_TTL = timedelta(minutes=30)
+GEMINI_CACHE_REFRESH = timedelta(minutes=2)  # recreate the cache this long before its TTL lapses
+GEMINI_FORMAT_RETRIES = 2   # re-asks, with the error, after unparseable / malformed output
 DEFAULT_MAX_AGE_HOURS = 26  # skip RSS entries older than this; 0 = no filter
+BACKOFF_INITIAL = 2.0       # first sleep after a temporary 429 with no retry hint
+BACKOFF_FACTOR = 1.5        # growth per consecutive 429; reset on the next success
+BACKOFF_MAX = 60.0
+RATE_BACKOFF = 0.5          # LLM pacing multiplier after a temporary 429
+RATE_STEP_RPM = 1.0         # RPM regained per successful call, up to the configured RPM
+RATE_FLOOR_RPM = 1.0
+DEFAULT_FEED_WORKERS = 10   # concurrent feed fetches + parses; --fetch-workers
+ARTICLE_FETCH_WORKERS = 10  # max in-flight article fetches; LLM calls stay serial; --article-workers
+HTTP_HEADERS = {
+    "User-Agent": "AnythingButMetric-Scraper/1.0",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": "gzip, deflate",  # no "br": brotli isn't installed
+}
+# Headroom above ARTICLE_FETCH_WORKERS for Jina fallbacks and redirects to new hosts;
+# idle keep-alive sockets are capped lower since most hosts are only hit once or twice
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+HTTP_CONNECT_RETRIES = 2
+# Main body text only: no comments or tables, and no readability/jusText fallback
+# passes (fast) — a page trafilatura can't handle goes to Plasmate / Jina instead
+TRAFILATURA_OPTIONS = {"include_comments": False, "include_tables": False, "fast": True}
+TEXT_CACHE_TTL = 24 * 3600      # fetched article text, keyed by URL
+LLM_CACHE_TTL = 7 * 24 * 3600   # LLM answers; short-ish because the prompt keeps evolving
+FEED_STATE_TTL = 30 * 24 * 3600  # per-feed ETag / Last-Modified for conditional GETs
+CACHE_SIZE_LIMIT = 256 << 20     # bytes; least-recently-stored entries are evicted beyond this
+LLM_BATCH_SIZE = 5          # max articles per LLM request in RSS mode
+LLM_BATCH_CHARS = 12000     # max total article text per LLM request
+LLM_TEXT_CHARS = 4000       # article text sent for a lone article
+LLM_BATCH_TEXT_CHARS = 3000  # per-article text when batched, to bound the prompt
+LLM_CONTEXT_CHARS = 400     # context kept either side of each comparison phrase
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def json_loads(data: str | bytes):
+    """Parse a JSON document (LLM answers, cached values), with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Compact JSON text; both branches emit the same string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 def load_json(path: Path) -> list:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
 
 def save_json(path: Path, data: list) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    # Both branches produce the same bytes: 2-space indent, raw UTF-8, trailing newline
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def append_json(path: Path, records: list) -> None:
+    """Append records to the JSON array in path without rewriting the file.
+
+    The result is byte-identical to save_json() of the combined list: the
+    closing bracket is cut off and the new items are written in its place,
+    so each run's I/O is proportional to what it adds. The frontend reads
+    these files as plain JSON arrays, which rules out JSONL.
+    """
+    with open(path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - 64))
+        end = f.read()
+        stripped = end.rstrip()
+        if not stripped.endswith(b"]"):
+            raise ValueError(f"{path} does not end with a JSON array")
+        body = stripped[:-1].rstrip()
+        if not body.endswith(b"["):
+            if orjson is not None:
+                tail = orjson.dumps(records, option=orjson.OPT_INDENT_2)
+            else:
+                tail = json.dumps(records, indent=2, ensure_ascii=False).encode("utf-8")
+            # Keep everything up to the last item's closing brace, then continue the array,
+            # and sync so the file is durable once this returns. The write is in place,
+            # not atomic: a crash part-way through can still leave a truncated array
+            # (git keeps the last committed copy).
+            f.seek(size - len(end) + len(body))
+            f.write(b"," + tail[1:] + b"\n")
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+            return
+    # Empty array on disk: nothing to join onto
+    save_json(path, records)
+
+
+_cache: diskcache.Cache | None = None  # opened by main() unless --no-cache
+
+
+def emit_new_edges(n: int) -> None:
+    """Write the NEW_EDGES=<n> sentinel the workflows read from stdout.
+
+    Written as raw bytes and flushed once; logging goes to stderr, so this is
+    the only thing on stdout.
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(b"NEW_EDGES=%d\n" % n)
+    sys.stdout.flush()
+
+
+def cache_key(kind: str, *parts: str) -> str:
+    # Length-prefix each part so no split of the same bytes can collide
+    h = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return f"{kind}:{h.hexdigest()}"
+
+
+def cache_get(key: str):
+    return _cache.get(key) if _cache is not None else None
+
+
+def cache_set(key: str, value, ttl: int) -> None:
+    if _cache is not None:
+        _cache.set(key, value, expire=ttl)
+
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+
+def canonical_url(url: str) -> str:
+    """Normalise an article URL for "already seen" checks.
+
+    Folds http into https, lowercases the host, and drops trailing slashes,
+    fragments and tracking parameters, so the same article linked from two
+    feeds (or re-tagged by one) is only fetched once.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    ])
+    return urlunsplit((scheme, parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+def feed_validators(feed_url: str) -> dict[str, str]:
+    """ETag / Last-Modified saved from the feed's last fully processed fetch, if any."""
+    return cache_get(cache_key("feed", feed_url)) or {}
+
+
+def remember_feed_validators(feed_url: str, feed: dict) -> None:
+    """Save the feed's validators so the next run can send a conditional GET.
+
+    Only called once every entry of the fetched feed has been handled — none
+    cut by --max-entries, every page fetched, every LLM batch answered: a 304
+    next run means "nothing new", which must not hide entries this run skipped.
+    """
+    state = {k: feed[k] for k in ("etag", "modified") if feed.get(k)}
+    if state:
+        cache_set(cache_key("feed", feed_url), state, FEED_STATE_TTL)
+
+
+_SLUG_STRIP = re.compile(r"[^\w\s]")
+_SLUG_SEP = re.compile(r"[\s_]+")  # whitespace and underscore runs → one "_"
 
 
 def slugify(label: str) -> str:
     """Convert a label to a snake_case id."""
-    s = label.lower()
-    s = re.sub(r"[^\w\s]", "", s)
-    s = re.sub(r"\s+", "_", s.strip())
-    s = re.sub(r"_+", "_", s)
-    return s
+    return _SLUG_SEP.sub("_", _SLUG_STRIP.sub("", label.lower()).strip())
+
 
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
 
-def fetch_article_text(url: str) -> str | None:
-    """Fetch article plain text via trafilatura (primary) or Jina Reader (fallback).
 
-    Returns None if both strategies fail; caller falls back to RSS summary.
+def html_to_text(markup: str) -> str:
+    """Strip tags, joining text nodes with single spaces.
+
+    Uses lxml's C parser; output matches BeautifulSoup's
+    get_text(separator=" ", strip=True) up to whitespace runs. Input with no
+    tags or entities (most RSS summaries) skips the parser entirely.
     """
-    # 1. trafilatura — direct HTTP GET; smart local extraction, zero external API calls
+    if "<" not in markup and "&" not in markup:
+        return " ".join(markup.split())
     try:
-        resp = requests.get(
-            url,
-            headers={"User-Agent": "AnythingButMetric-Scraper/1.0"},
-            timeout=FETCH_TIMEOUT,
+        # Parse as UTF-8 bytes: lxml rejects str input carrying an XML encoding declaration
+        root = lxml_html.fromstring(markup.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+    except etree.LxmlError:  # empty / whitespace-only document
+        return ""
+    # BeautifulSoup's get_text() leaves out script / style / template contents
+    etree.strip_elements(root, "script", "style", "template", with_tail=False)
+    return " ".join(" ".join(root.itertext()).split())
+
+
+def http_client() -> httpx.AsyncClient:
+    """AsyncClient used for article fetches.
+
+    Must be opened inside the event loop that uses it — a client (and its
+    connection pool) can't outlive the loop started by asyncio.run().
+    """
+    # The transport owns the pool, so limits/http2 go on it; retries re-attempt
+    # failed connects (DNS blips, resets), not HTTP error statuses
+    transport = httpx.AsyncHTTPTransport(
+        limits=HTTP_POOL_LIMITS,
+        http2=True,
+        retries=HTTP_CONNECT_RETRIES,
+    )
+    return httpx.AsyncClient(
+        headers=HTTP_HEADERS,
+        transport=transport,
+        timeout=FETCH_TIMEOUT,
+        follow_redirects=True,
+    )
+
+
+async def fetch_article_text(client: httpx.AsyncClient, url: str) -> str | None:
+    """Fetch article plain text via trafilatura, then Plasmate (when installed), then Jina Reader.
+
+    Returns None if all three fail; caller falls back to RSS summary.
+    Successful fetches are cached by URL for TEXT_CACHE_TTL.
+    """
+    key = cache_key("text", url)
+    cached = cache_get(key)
+    if cached is not None:
+        log.debug("  fetch: cache hit (%d chars)", len(cached))
+        return cached
+
+    text = await _fetch_article_text(client, url)
+    if text:
+        cache_set(key, text, TEXT_CACHE_TTL)
+    return text
+
+
+_PLASMATE = shutil.which("plasmate")
+
+
+async def fetch_via_plasmate(url: str) -> str | None:
+    """Main content from `plasmate fetch <url>` (JSON on stdout), or None.
+
+    Its structured output is far leaner than Jina's page dump, so it is tried
+    first when the binary is on PATH; otherwise this is a no-op.
+    """
+    if _PLASMATE is None:
+        return None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            _PLASMATE, "fetch", url,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        if resp.ok:
-            result = trafilatura.extract(resp.content)
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), PLASMATE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            log.debug("  fetch: Plasmate timed out")
+            return None
+        if proc.returncode != 0:
+            log.debug("  fetch: Plasmate exited %s", proc.returncode)
+            return None
+        content = json.loads(stdout).get("main_content") or ""
+        if isinstance(content, list):
+            content = "\n\n".join(str(part) for part in content)
+        text = content.strip()
+    except Exception as exc:
+        log.debug("  fetch: Plasmate error (%s)", exc)
+        return None
+    if len(text) > 200:
+        log.debug("  fetch: Plasmate OK (%d chars)", len(text))
+        return text
+    log.debug("  fetch: Plasmate too little text (%d chars)", len(text))
+    return None
+
+
+async def _fetch_article_text(client: httpx.AsyncClient, url: str) -> str | None:
+    # 1. trafilatura — direct HTTP GET; smart local extraction, zero external API calls
+    try:
+        resp = await client.get(url, timeout=FETCH_TIMEOUT)
+        if resp.is_success:
+            # Extraction is CPU-bound and quick; run it inline rather than in a thread
+            result = trafilatura.extract(resp.content, **TRAFILATURA_OPTIONS)
             if result and len(result) > 200:
                 log.debug("  fetch: trafilatura OK (%d chars)", len(result))
                 return result
-            log.debug("  fetch: trafilatura got no content — trying Jina")
+            log.debug("  fetch: trafilatura got no content — trying fallbacks")
         else:
-            log.debug("  fetch: trafilatura HTTP %s — trying Jina", resp.status_code)
+            log.debug("  fetch: trafilatura HTTP %s — trying fallbacks", resp.status_code)
     except Exception as exc:
-        log.debug("  fetch: trafilatura error (%s) — trying Jina", exc)
+        log.debug("  fetch: trafilatura error (%s) — trying fallbacks", exc)
 
-    # 2. Jina Reader — external API, headless browser for JS-rendered pages
+    # 2. Plasmate — optional local structured extractor; skipped when not installed
+    text = await fetch_via_plasmate(url)
+    if text:
+        return text
+
+    # 3. Jina Reader — external API, headless browser for JS-rendered pages
     try:
-        resp = requests.get(
+        resp = await client.get(
             f"https://r.jina.ai/{url}",
-            headers={
-                "X-Return-Format": "text",
-                "User-Agent": "AnythingButMetric-Scraper/1.0",
-            },
+            headers={"Accept": "text/plain", "X-Return-Format": "text"},
             timeout=JINA_TIMEOUT,
         )
-        if resp.ok:
+        if resp.is_success:
             text = resp.text.strip()
             if len(text) > 200:
                 log.debug("  fetch: Jina OK (%d chars)", len(text))
@@ -126,17 +410,184 @@ def fetch_article_text(url: str) -> str | None:
     return None
 
 
+FEED_HEADERS = {
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, "
+              "text/xml;q=0.9, */*;q=0.8",
+}
+_FEED_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, recover=False)
+
+
+def _feed_date(raw: str | None) -> time.struct_time | None:
+    """RFC 822 (RSS) or ISO 8601 (Atom) date as a UTC struct_time, like feedparser's *_parsed.
+
+    Raises ValueError for anything else so the caller can fall back to feedparser.
+    """
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        dt = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        dt = datetime.fromisoformat(raw)  # ValueError propagates
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.utctimetuple()
+
+
+# RSS 2.0's <link> has no namespace; RSS 1.0 puts it in the document's default one
+_RSS_LINK_TAGS = ("link", "{http://purl.org/rss/1.0/}link")
+_SUMMARY_TAGS = (
+    "{*}summary", "{*}description", "{*}content",
+    "{http://purl.org/rss/1.0/modules/content/}encoded",  # RSS content:encoded
+)
+
+
+def _entry_link(item, rss: bool) -> str:
+    if rss:
+        # Like feedparser: the item's own <link> wins over any atom:link beside it
+        for tag in _RSS_LINK_TAGS:
+            text = item.findtext(tag)
+            if text and text.strip():
+                return text.strip()
+    for link in item.iterfind("{*}link"):
+        if link.text and link.text.strip():
+            return link.text.strip()
+        if link.get("href") and link.get("rel", "alternate") == "alternate":
+            return link.get("href").strip()  # Atom (skips rel="self" etc.)
+    # RSS item without <link>: feedparser treats a permalink <guid> as the link
+    guid = item.find("{*}guid")
+    if guid is not None and guid.text and guid.get("isPermaLink", "true").lower() != "false":
+        return guid.text.strip()
+    return ""
+
+
+def fast_parse_feed(content: bytes) -> dict | None:
+    """Parse an RSS 2.0 / RSS 1.0 / Atom document with lxml, reading only what the
+    scraper uses: version, and each entry's link, summary and dates.
+
+    Returns None when the document isn't a well-formed feed this understands,
+    so parse_feed_content() can hand it to feedparser instead.
+    """
+    try:
+        root = etree.fromstring(content, parser=_FEED_XML_PARSER)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+    kind = etree.QName(root).localname
+    if kind not in ("rss", "feed", "RDF"):
+        return None
+
+    entries = []
+    for item in root.iter("{*}item", "{*}entry"):
+        summary = next(
+            (el for tag in _SUMMARY_TAGS if (el := item.find(tag)) is not None),
+            None,
+        )
+        try:
+            published = _feed_date(
+                item.findtext("{*}pubDate") or item.findtext("{*}published")
+                or item.findtext("{*}date")  # RSS 1.0 dc:date
+            )
+            updated = _feed_date(item.findtext("{*}updated")) or published
+        except ValueError:
+            return None  # unusual date format: feedparser knows many more
+        link = _entry_link(item, kind != "feed")
+        if not link:
+            return None  # leave linkless entries to feedparser's fallbacks
+        entries.append({
+            "link": link,
+            "summary": "".join(summary.itertext()) if summary is not None else "",
+            "published_parsed": published,
+            "updated_parsed": updated,
+        })
+    return {"version": {"rss": "rss", "feed": "atom", "RDF": "rss10"}[kind], "entries": entries}
+
+
+def parse_feed_content(content: bytes) -> dict:
+    """Feed dict with "version" and "entries" — lxml fast path, feedparser otherwise.
+
+    Blocking and CPU-bound (feedparser especially), so callers run it on a pool.
+    """
+    parsed = fast_parse_feed(content)
+    if parsed is not None:
+        return parsed
+    feed = feedparser.parse(content)
+    return {"version": feed.get("version", ""), "entries": feed.get("entries", [])}
+
+
+async def fetch_feed(
+    client: httpx.AsyncClient,
+    url: str,
+    validators: dict[str, str],
+) -> tuple[dict, bytes]:
+    """GET a feed, sending any saved validators as a conditional request.
+
+    Returns the feed's status / etag / modified (the fields remember_feed_validators
+    reads) and the raw body, which is empty for a 304.
+    """
+    headers = dict(FEED_HEADERS)
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+    resp = await client.get(url, headers=headers)
+    meta = {
+        "status": resp.status_code,
+        "etag": resp.headers.get("etag"),
+        "modified": resp.headers.get("last-modified"),
+    }
+    return meta, resp.content if resp.is_success else b""
+
+
+def _units_field(value) -> str:
+    # Tabs, newlines and "|" are the table's delimiters; fold them into spaces.
+    # Catalogue values are not guaranteed to be strings (a null label, a numeric alias).
+    if value is None:
+        return ""
+    return " ".join(str(value).replace("|", " ").split())
+
+
 def build_units_prompt_block(units: list[dict]) -> str:
-    """Compact JSON list of known units for the prompt."""
-    simplified = [
-        {"id": u["id"], "label": u["label"], "aliases": u.get("aliases", [])}
-        for u in units
-    ]
-    return json.dumps(simplified, ensure_ascii=False)
+    """Known units for the prompt, one per line: id<TAB>label<TAB>alias|alias.
+
+    Roughly half the size of the equivalent JSON list, and every byte of it is
+    sent with each LLM request.
+    """
+    lines = []
+    for u in units:
+        aliases = u.get("aliases")
+        if not isinstance(aliases, list):
+            aliases = [aliases]
+        fields = (_units_field(a) for a in aliases)
+        lines.append(
+            f"{_units_field(u['id'])}\t{_units_field(u.get('label'))}\t"
+            + "|".join(f for f in fields if f)
+        )
+    return "\n".join(lines)
+
+
+_units_block_cache: tuple[int, str] = (-1, "")
 
 
+def units_prompt_block(units: list[dict], new_units_map: dict[str, dict]) -> str:
+    """Prompt block for known units plus units created this run, cached between articles.
+
+    Units are only ever added during a run, so the combined count identifies
+    the catalogue version; the block is rebuilt only when a new unit appears.
+    """
+    global _units_block_cache
+    version = len(units) + len(new_units_map)
+    if _units_block_cache[0] != version:
+        all_units = units + list(new_units_map.values())
+        _units_block_cache = (version, build_units_prompt_block(all_units))
+    return _units_block_cache[1]
+
+
+# Everything that is identical across calls comes first and the article texts
+# last, so providers with prefix caching (Gemini 2.5 implicit caching) can
+# reuse the instructions + units block between calls. One call carries up to
+# LLM_BATCH_SIZE articles; a single article is just a batch of one.
 EXTRACTION_PROMPT_TEMPLATE = """\
-You are extracting journalistic unit comparisons from a news article.
+You are extracting journalistic unit comparisons from news articles.
 
 A journalistic unit comparison uses something UNFAMILIAR to help the reader picture scale by \
 comparing it to something FAMILIAR and PHYSICAL. The reader should finish the sentence with a \
@@ -148,7 +599,7 @@ GOOD examples — these are valid comparisons:
   "The whale weighs as much as 30 double-decker buses."
   "The Great Barrier Reef is the size of 70 million football pitches."
 
-BAD examples — these are NOT comparisons; return [] for articles that only contain these:
+BAD examples — these are NOT comparisons; return no comparisons for articles that only contain these:
   "The temperature rose by 2.5°C."              ← raw statistic; no reference object
   "The mission lasted 9 months."                ← duration, not a size comparison
   "The rocket rose 80 feet into the air."       ← raw measurement with no reference object
@@ -163,15 +614,10 @@ BAD examples — these are NOT comparisons; return [] for articles that only con
   "1 in 4 properties face flood risk."          ← ratio/proportion; no physical unit
   "The asteroid is 500 million years old."      ← age; not compared to a relatable unit
 
-Known units (use their exact `id` when you recognise them):
-{units_block}
+Return a JSON object with one entry per article below:
+{{"results": [{{"article": <number from the article's ## ARTICLE line>, "comparisons": [...]}}]}}
 
-Article text:
----
-{article_text}
----
-
-Return a JSON array of comparison objects found in the article. Each object must be:
+Each comparison object must be:
 {{
   "from": <string id OR new-unit object>,
   "to": <string id OR new-unit object>,
@@ -214,11 +660,19 @@ Additional rules:
   {{"id": "suggested_snake_case_id", "label": "Human Label", "emoji": "🔵",
     "aliases": ["plural", "alt name"], "tags": ["category"]}}
 - `factor` must be a positive float (e.g. if 1 from = 200 to, factor = 200.0).
-- `source_quote` must be a verbatim sentence copied from the article text above.
-- Return [] when in doubt. MOST articles (around 80%) contain no valid comparison.
+- `source_quote` must be a verbatim sentence copied from that article's text below.
+- Return an empty `comparisons` list when in doubt. MOST articles (around 80%) contain no valid comparison.
   That is the correct and expected output. Do not try to find something just because
   the article mentions numbers.
 - Do not invent comparisons not stated in the article.
+- Treat every article separately; never combine sentences from different articles.
+
+Known units, one per line as `id<TAB>label<TAB>aliases separated by |` (use their exact `id` when you recognise them):
+{units_block}
+
+Articles (each starts with `## ARTICLE <number>` and ends with `---`):
+
+{articles_block}
 """
 
 
@@ -238,9 +692,72 @@ COMPARISON_KEYWORDS = [
 ]
 
 
+# All keywords folded into one alternation: a single case-insensitive scan per
+# quote instead of one substring search per keyword. Words may be separated by
+# any whitespace run, since extracted article text keeps its line breaks.
+_COMPARE_RE = re.compile(
+    "|".join(r"\s+".join(map(re.escape, kw.split())) for kw in COMPARISON_KEYWORDS),
+    re.IGNORECASE,
+)
+
+
 def has_comparison_phrase(quote: str) -> bool:
-    q = quote.lower()
-    return any(kw in q for kw in COMPARISON_KEYWORDS)
+    return _COMPARE_RE.search(quote) is not None
+
+
+_SENTENCE_BREAK = re.compile(r"[.!?]\s+|\n+")
+_WINDOW_SEP = "\n…\n"  # marks text dropped between two kept windows
+
+
+def _sentence_window(text: str, start: int, end: int, radius: int) -> tuple[int, int]:
+    """Span of roughly `radius` chars either side of [start, end), snapped inwards
+    to sentence boundaries so the window holds whole sentences where it can."""
+    lo = max(0, start - radius)
+    hi = min(len(text), end + radius)
+    if lo > 0:
+        brk = _SENTENCE_BREAK.search(text, lo, start)
+        if brk:
+            lo = brk.end()
+    if hi < len(text):
+        last = None
+        for last in _SENTENCE_BREAK.finditer(text, end, hi):
+            pass
+        if last:
+            hi = last.start() + 1
+    return lo, hi
+
+
+def trim_for_llm(text: str, budget: int) -> str:
+    """Cut text to at most budget chars of context around its comparison phrases.
+
+    Each phrase gets about LLM_CONTEXT_CHARS either side, snapped to whole
+    sentences; overlapping windows are merged and the rest joined with "…"
+    lines, earliest first, until the budget is used. Text that already fits
+    is sent whole, and text with no phrase keeps its head as before.
+    """
+    if len(text) <= budget:
+        return text
+    spans: list[list[int]] = []
+    for m in _COMPARE_RE.finditer(text):
+        if spans and m.start() < spans[-1][1]:
+            continue  # already inside the previous window
+        lo, hi = _sentence_window(text, m.start(), m.end(), LLM_CONTEXT_CHARS)
+        if spans and lo <= spans[-1][1]:
+            spans[-1][1] = hi
+        else:
+            spans.append([lo, hi])
+    if not spans:
+        return text[:budget]
+
+    pieces: list[str] = []
+    used = 0
+    for lo, hi in spans:
+        piece = text[lo:hi].strip()
+        if pieces and used + len(piece) + len(_WINDOW_SEP) > budget:
+            break
+        pieces.append(piece[:budget])
+        used += len(piece) + len(_WINDOW_SEP)
+    return _WINDOW_SEP.join(pieces)
 
 
 def entry_is_recent(entry: dict, max_age_hours: int) -> bool:
@@ -258,20 +775,151 @@ def entry_is_recent(entry: dict, max_age_hours: int) -> bool:
     return age_seconds <= max_age_hours * 3600
 
 
-_last_groq_call: float = 0.0
-_last_gemini_call: float = 0.0
+class RateLimiter:
+    """Token bucket: up to `burst` calls at once, refilled at `rpm` per minute.
+
+    Replaces a strict minimum gap between calls, so an idle spell earns a
+    few back-to-back calls without ever exceeding the average RPM.
+    Adaptive: a temporary 429 halves the refill rate and empties the bucket
+    (on_failure), and each success wins back one RPM (on_success), never
+    above the configured `rpm`. Thread-safe; acquire() sleeps outside the lock.
+    """
+
+    def __init__(self, rpm: float, burst: int, name: str) -> None:
+        self.max_rate = rpm / 60.0
+        self.rate = self.max_rate
+        self.burst = float(burst)
+        self.name = name
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            log.debug("  llm: %s rate-limiting, sleeping %.1fs", self.name, wait)
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_STEP_RPM / 60.0)
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self.rate = max(RATE_FLOOR_RPM / 60.0, self.rate * RATE_BACKOFF)
+            self._tokens = 0.0
+        log.debug("  llm: %s pacing reduced to %.1f RPM", self.name, self.rate * 60)
+
+
+GROQ_LIMITER = RateLimiter(GROQ_RPM, GROQ_BURST, "Groq")
+GEMINI_LIMITER = RateLimiter(GEMINI_RPM, GEMINI_BURST, "Gemini")
 _groq_quota_exhausted: bool = False
 _gemini_quota_exhausted: bool = False
+_groq_backoff = {"next_wait": BACKOFF_INITIAL}
+_gemini_backoff = {"next_wait": BACKOFF_INITIAL}
+_groq_client = None   # built on first use, reused for every article
+_gemini_model = None
+_gemini_cache = None  # (prompt prefix, model bound to its CachedContent, CachedContent, monotonic expiry)
+_gemini_cache_disabled: bool = False
 
 
-def call_groq(article_text: str, units: list[dict]) -> list[dict] | None:
-    """Call Groq (Llama) and return comparisons, or None on any failure.
+def _backoff_sleep(state: dict, provider: str) -> None:
+    """Sleep after a temporary rate limit, growing the delay on consecutive hits.
 
-    Returns None (not []) on failure so call_llm() knows to try Gemini.
-    Returns [] when the model genuinely found no comparisons.
+    Jittered so that a burst of 429s doesn't line retries up on the same instant.
     """
-    global _last_groq_call, _groq_quota_exhausted
-    from groq import Groq, RateLimitError
+    wait = min(BACKOFF_MAX, state["next_wait"] * (1 + random.random() * 0.5))
+    log.debug("  llm: %s rate-limited (temporary), backing off %.1fs", provider, wait)
+    time.sleep(wait)
+    state["next_wait"] = min(BACKOFF_MAX, state["next_wait"] * BACKOFF_FACTOR)
+
+
+def _get_groq(api_key: str):
+    """Return the shared Groq client, creating it on first use."""
+    global _groq_client
+    if _groq_client is None:
+        from groq import Groq
+        _groq_client = Groq(api_key=api_key)
+    return _groq_client
+
+
+def _get_gemini(api_key: str):
+    """Return the shared Gemini model, configuring the SDK on first use."""
+    global _gemini_model
+    if _gemini_model is None:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        _gemini_model = genai.GenerativeModel(GEMINI_MODEL)
+    return _gemini_model
+
+
+def drop_gemini_cache() -> None:
+    """Forget the current context cache, deleting it server-side if still there."""
+    global _gemini_cache
+    if _gemini_cache is None:
+        return
+    cached, _gemini_cache = _gemini_cache[2], None
+    try:
+        cached.delete()
+    except Exception:
+        pass  # expires on its own
+
+
+def _get_gemini_cached(api_key: str, prefix: str):
+    """Return a Gemini model bound to an explicit context cache of `prefix`, or None.
+
+    The prefix (instructions + units block) only changes when a unit is added,
+    so it is uploaded once per version and each call sends just the articles.
+    Falls back (None) when the prefix is below the API's minimum cache size or
+    cache creation fails — e.g. tiers without explicit caching — after which
+    it isn't tried again this run. A cache close to its TTL is replaced rather
+    than reused, so long runs never call one the API has already deleted.
+    """
+    global _gemini_cache, _gemini_cache_disabled
+    if _gemini_cache_disabled or len(prefix) < GEMINI_CACHE_MIN_CHARS:
+        return None
+    if (
+        _gemini_cache is not None
+        and _gemini_cache[0] == prefix
+        and time.monotonic() < _gemini_cache[3] - GEMINI_CACHE_REFRESH.total_seconds()
+    ):
+        return _gemini_cache[1]
+
+    _get_gemini(api_key)  # configures the SDK
+    import google.generativeai as genai
+    from google.generativeai import caching
+    try:
+        cached = caching.CachedContent.create(
+            model=GEMINI_MODEL,
+            contents=[prefix],
+            ttl=GEMINI_CACHE_TTL,
+        )
+    except Exception as exc:
+        log.debug("  llm: Gemini context cache unavailable (%s) — sending full prompts", exc)
+        _gemini_cache_disabled = True
+        return None
+    drop_gemini_cache()  # superseded by the new units block, or about to expire
+    model = genai.GenerativeModel.from_cached_content(cached_content=cached)
+    expires = time.monotonic() + GEMINI_CACHE_TTL.total_seconds()
+    _gemini_cache = (prefix, model, cached, expires)
+    log.debug("  llm: Gemini context cache created (%d chars)", len(prefix))
+    return model
+
+
+def call_groq(prompt: str) -> dict | list | None:
+    """Call Groq (Llama) and return the parsed JSON answer, or None on any failure.
+
+    Returns None on failure so call_llm_batch() knows to try Gemini.
+    """
+    global _groq_quota_exhausted
+    from groq import RateLimitError
 
     if _groq_quota_exhausted:
         return None
@@ -280,50 +928,34 @@ def call_groq(article_text: str, units: list[dict]) -> list[dict] | None:
     if not api_key:
         return None  # no key configured; fall through to Gemini silently
 
-    min_interval = 60.0 / GROQ_RPM
-    elapsed = time.monotonic() - _last_groq_call
-    if elapsed < min_interval:
-        wait = min_interval - elapsed
-        log.debug("  llm: Groq rate-limiting, sleeping %.1fs", wait)
-        time.sleep(wait)
-    _last_groq_call = time.monotonic()
-
-    truncated = article_text[:4000]
-    prompt = EXTRACTION_PROMPT_TEMPLATE.format(
-        units_block=build_units_prompt_block(units),
-        article_text=truncated,
-    )
+    GROQ_LIMITER.acquire()
 
     try:
-        client = Groq(api_key=api_key)
-        response = client.chat.completions.create(
+        response = _get_groq(api_key).chat.completions.create(
             model=GROQ_MODEL,
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
             temperature=0,
         )
+        _groq_backoff["next_wait"] = BACKOFF_INITIAL
+        GROQ_LIMITER.on_success()
         raw = response.choices[0].message.content.strip()
-        parsed = json.loads(raw)
-        # Model returns either a top-level array or wraps it in an object
-        if isinstance(parsed, list):
-            return parsed
-        if isinstance(parsed, dict):
-            for key in ("comparisons", "results", "data", "items"):
-                if isinstance(parsed.get(key), list):
-                    return parsed[key]
-        log.warning("  llm: Groq unexpected JSON shape: %r", raw[:200])
-        return None
+        return json_loads(raw)
     except RateLimitError as exc:
         err = str(exc).lower()
         if "per_day" in err or "daily" in err:
             log.warning("  llm: Groq daily quota exhausted — disabling for this run")
             _groq_quota_exhausted = True
         else:
-            # Temporary TPM/RPM burst limit — sleep 60s, keep Groq alive for later articles
+            # Temporary TPM/RPM burst limit — wait it out, keep Groq alive for later
+            # articles. Honour the server's hint when given, else back off.
+            GROQ_LIMITER.on_failure()
             m = re.search(r"retry.after[^\d]*(\d+)", err, re.IGNORECASE)
-            retry_secs = int(m.group(1)) if m else 60
-            log.debug("  llm: Groq rate-limited (temporary), sleeping %ds", retry_secs)
-            time.sleep(retry_secs)
+            if m:
+                log.debug("  llm: Groq rate-limited (temporary), sleeping %ss", m.group(1))
+                time.sleep(int(m.group(1)))
+            else:
+                _backoff_sleep(_groq_backoff, "Groq")
         return None
     except json.JSONDecodeError as exc:
         log.warning("  llm: Groq JSON parse error: %s", exc)
@@ -333,50 +965,59 @@ def call_groq(article_text: str, units: list[dict]) -> list[dict] | None:
         return None
 
 
-def call_gemini(article_text: str, units: list[dict]) -> list[dict]:
-    """Call Gemini Flash and return parsed comparison objects."""
-    global _last_gemini_call, _gemini_quota_exhausted
-    import google.generativeai as genai
+def call_gemini(prompt: str, prefix: str = "", validate=None) -> dict | list | None:
+    """Call Gemini Flash and return the parsed JSON answer, or None on any failure.
+
+    When `prefix` starts the prompt it is served from an explicit context
+    cache where possible, and only the rest of the prompt is sent. Output
+    that isn't JSON, or that `validate(parsed)` rejects, is sent back with
+    the problem in the same chat, up to GEMINI_FORMAT_RETRIES times.
+    """
+    global _gemini_quota_exhausted
 
     if _gemini_quota_exhausted:
-        return []
+        return None
 
     api_key = os.environ.get("GOOGLE_AI_API_KEY")
     if not api_key:
         log.warning("  llm: GOOGLE_AI_API_KEY not set")
-        return []
+        return None
 
-    min_interval = 60.0 / GEMINI_RPM
-    elapsed = time.monotonic() - _last_gemini_call
-    if elapsed < min_interval:
-        wait = min_interval - elapsed
-        log.debug("  llm: Gemini rate-limiting, sleeping %.1fs", wait)
-        time.sleep(wait)
-
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel(GEMINI_MODEL)
-    _last_gemini_call = time.monotonic()
-
-    truncated = article_text[:4000]
-    prompt = EXTRACTION_PROMPT_TEMPLATE.format(
-        units_block=build_units_prompt_block(units),
-        article_text=truncated,
-    )
+    GEMINI_LIMITER.acquire()
 
+    used_cache = False
     try:
-        response = model.generate_content(
-            prompt,
-            generation_config={"response_mime_type": "application/json"},
-        )
-        raw = response.text.strip()
-        parsed = json.loads(raw)
-        if not isinstance(parsed, list):
-            log.warning("  llm: Gemini non-list response: %r", raw[:200])
-            return []
-        return parsed
-    except json.JSONDecodeError as exc:
-        log.warning("  llm: Gemini JSON parse error: %s", exc)
-        return []
+        model = _get_gemini_cached(api_key, prefix) if prefix and prompt.startswith(prefix) else None
+        used_cache = model is not None
+        if used_cache:
+            message = prompt[len(prefix):]
+        else:
+            model, message = _get_gemini(api_key), prompt
+        chat = model.start_chat()
+        for attempt in range(GEMINI_FORMAT_RETRIES + 1):
+            if attempt:
+                GEMINI_LIMITER.acquire()  # every retry is a request against the RPM budget
+            response = chat.send_message(
+                message,
+                generation_config={"response_mime_type": "application/json"},
+            )
+            _gemini_backoff["next_wait"] = BACKOFF_INITIAL
+            GEMINI_LIMITER.on_success()
+            try:
+                parsed = json_loads(response.text.strip())
+            except json.JSONDecodeError as exc:
+                problem = f"was not valid JSON ({exc})"
+            else:
+                if validate is None or validate(parsed):
+                    return parsed
+                problem = "did not match the required output format"
+            retrying = attempt < GEMINI_FORMAT_RETRIES
+            log.warning("  llm: Gemini output %s%s", problem, " — asking again" if retrying else "")
+            message = (
+                f"Your previous output {problem}. Return only the JSON object described "
+                "in the instructions, with one entry per article."
+            )
+        return None
     except Exception as exc:
         err = str(exc)
         m = re.search(r"retry_delay\s*\{\s*seconds:\s*(\d+)", err)
@@ -385,23 +1026,165 @@ def call_gemini(article_text: str, units: list[dict]) -> list[dict]:
             log.warning("  llm: Gemini daily quota exhausted")
             _gemini_quota_exhausted = True
         elif retry_secs:
+            GEMINI_LIMITER.on_failure()
             log.debug("  llm: Gemini rate-limited, sleeping %ds", retry_secs)
             time.sleep(retry_secs)
+        elif "429" in err:
+            GEMINI_LIMITER.on_failure()
+            _backoff_sleep(_gemini_backoff, "Gemini")
+        elif used_cache:
+            # Most likely the cache itself (expired / deleted): drop it and
+            # resend the whole prompt uncached; the next batch makes a new one
+            log.warning("  llm: Gemini error on cached prompt (%s) — retrying without cache", exc)
+            drop_gemini_cache()
+            return call_gemini(prompt, validate=validate)
         else:
             log.warning("  llm: Gemini error: %s", exc)
-        return []
+        return None
+
+
+# Part of every LLM cache key, so editing the prompt invalidates cached answers
+PROMPT_VERSION = hashlib.sha256(EXTRACTION_PROMPT_TEMPLATE.encode("utf-8")).hexdigest()[:16]
+_PROMPT_HEAD, _, _PROMPT_TAIL = EXTRACTION_PROMPT_TEMPLATE.partition("{articles_block}")
+_PROMPT_TAIL = _PROMPT_TAIL.format()  # unescape any {{ }} after the placeholder
+
+
+@lru_cache(maxsize=1)
+def prompt_prefix(units_block: str) -> str:
+    """Everything in the extraction prompt before the articles, for one units block.
+
+    units_prompt_block() hands back the same string object until the catalogue
+    changes, so this formats the multi-KB template once per catalogue version
+    rather than once per call.
+    """
+    return _PROMPT_HEAD.format(units_block=units_block)
 
 
-def call_llm(article_text: str, units: list[dict]) -> list[dict]:
-    """Try Groq first, fall back to Gemini if Groq is unavailable."""
-    result = call_groq(article_text, units)
-    if result is not None:
-        return result  # Groq succeeded (even if empty — that's a valid answer)
+def build_extraction_prompt(articles: list[tuple[str, str]], units_block: str) -> str:
+    """Format the extraction prompt for (article_id, text) pairs; texts are already trimmed."""
+    articles_block = "\n\n".join(
+        f"## ARTICLE {article_id}\n{text}\n---" for article_id, text in articles
+    )
+    return prompt_prefix(units_block) + articles_block + _PROMPT_TAIL
+
+
+def parse_batch_answer(parsed, article_ids: list[str]) -> dict[str, list] | None:
+    """Map a model answer onto article ids, or None if its shape is unusable.
+
+    Articles the model left out of `results` count as having no comparisons.
+    A bare list (or a list under another key) is accepted for a single article,
+    since models sometimes ignore the wrapper for a batch of one.
+    """
+    if isinstance(parsed, dict) and isinstance(parsed.get("results"), list):
+        by_id: dict[str, list] = {article_id: [] for article_id in article_ids}
+        for item in parsed["results"]:
+            if not isinstance(item, dict):
+                continue
+            article_id = str(item.get("article"))  # models may echo 1 for "1"
+            comparisons = item.get("comparisons")
+            if article_id in by_id and isinstance(comparisons, list):
+                by_id[article_id] = comparisons
+        return by_id
+    if len(article_ids) == 1:
+        if isinstance(parsed, list):
+            return {article_ids[0]: parsed}
+        if isinstance(parsed, dict):
+            for key in ("comparisons", "data", "items"):
+                if isinstance(parsed.get(key), list):
+                    return {article_ids[0]: parsed[key]}
+    return None
+
+
+def call_llm_batch(articles: list[tuple[str, str]], units_block: str) -> dict[str, list[dict] | None]:
+    """Extract comparisons for several (article_url, text) pairs in one LLM request.
+
+    Tries Groq first, falls back to Gemini if Groq is unavailable. Answers are
+    cached per article by (models, prompt version, units block, trimmed text)
+    for LLM_CACHE_TTL, and
+    only uncached articles are sent; failures are not cached so those articles
+    are retried on the next run. Every input url is present in the result,
+    mapped to None when no LLM produced a usable answer.
+    """
+    budget = LLM_TEXT_CHARS if len(articles) == 1 else LLM_BATCH_TEXT_CHARS
+    results: dict[str, list[dict] | None] = {}
+    pending: list[tuple[str, str]] = []
+    keys: dict[str, str] = {}
+    for url, text in articles:
+        text = trim_for_llm(text, budget)
+        keys[url] = cache_key("llm", GROQ_MODEL, GEMINI_MODEL, PROMPT_VERSION, units_block, text)
+        cached = cache_get(keys[url])
+        if cached is not None:
+            log.debug("  llm: cache hit for %s", url)
+            results[url] = json_loads(cached)
+        else:
+            pending.append((url, text))
+    if not pending:
+        return results
+
+    # Articles are labelled 1..n in the prompt: short ids the model echoes back
+    # reliably, where long URLs get truncated or mangled
+    ids = [str(i) for i in range(1, len(pending) + 1)]
+    prompt = build_extraction_prompt(
+        [(article_id, text) for article_id, (_, text) in zip(ids, pending)], units_block
+    )
+    answer = None
+    parsed = call_groq(prompt)
+    if parsed is not None:
+        answer = parse_batch_answer(parsed, ids)
+        if answer is None:
+            log.warning("  llm: Groq unexpected JSON shape: %r", json.dumps(parsed)[:200])
     # Groq returned None: quota hit or error — try Gemini
-    if not _gemini_quota_exhausted:
+    if answer is None and not _gemini_quota_exhausted:
         log.debug("  llm: trying Gemini fallback")
-        return call_gemini(article_text, units)
-    return []
+        parsed = call_gemini(
+            prompt,
+            prompt_prefix(units_block),
+            validate=lambda parsed: parse_batch_answer(parsed, ids) is not None,
+        )
+        if parsed is not None:
+            answer = parse_batch_answer(parsed, ids)
+            if answer is None:
+                log.warning("  llm: Gemini unexpected JSON shape: %r", json.dumps(parsed)[:200])
+
+    for article_id, (url, _) in zip(ids, pending):
+        if answer is None:
+            results[url] = None
+            continue
+        # Even an empty list is a valid answer worth remembering
+        results[url] = answer[article_id]
+        cache_set(keys[url], json_dumps(answer[article_id]), LLM_CACHE_TTL)
+    return results
+
+
+class LLMBatcher:
+    """Groups (article_url, text) pairs into LLM requests.
+
+    A batch is released once it holds LLM_BATCH_SIZE articles, or when the
+    next article would push its text past LLM_BATCH_CHARS; short articles
+    therefore share a request while long ones stay in smaller batches.
+    Text is counted as trimmed for a batched prompt.
+    """
+
+    def __init__(self) -> None:
+        self.pending: list[tuple[str, str]] = []
+        self.chars = 0
+
+    def add(self, article_url: str, text: str) -> list[tuple[str, str]] | None:
+        """Queue one article; return a batch that is ready to send, if any."""
+        size = min(len(text), LLM_BATCH_TEXT_CHARS)
+        ready = None
+        if self.pending and self.chars + size > LLM_BATCH_CHARS:
+            ready = self.drain()
+        self.pending.append((article_url, text))
+        self.chars += size
+        if ready is None and len(self.pending) == LLM_BATCH_SIZE:
+            ready = self.drain()
+        return ready
+
+    def drain(self) -> list[tuple[str, str]]:
+        """Return whatever is queued (possibly nothing) and start a new batch."""
+        batch, self.pending, self.chars = self.pending, [], 0
+        return batch
 
 
 def _all_llms_exhausted() -> bool:
@@ -412,7 +1195,21 @@ def _all_llms_exhausted() -> bool:
 # Validation helpers + per-article pipeline
 # ---------------------------------------------------------------------------
 
-def validate_comparison(comp: dict, existing_ids: set[str]) -> bool:
+# (from, to, factor, source_url) of an edge dict in one C-level call
+edge_key_fields = itemgetter("from", "to", "factor", "source_url")
+
+
+def edge_hash(from_id: str, to_id: str, factor: float, source_url: str) -> int:
+    """Dedup key for an edge: the 64-bit hash of its (from, to, factor, url) tuple.
+
+    Storing ints instead of 4-tuples keeps the dedup set small. The key only
+    lives for one run, so per-process str hash randomisation doesn't matter,
+    and a collision would at worst drop one candidate edge.
+    """
+    return hash((from_id, to_id, factor, source_url))
+
+
+def validate_comparison(comp: dict) -> bool:
     """Return True if comp looks structurally valid and passes hard keyword filter."""
     if not isinstance(comp, dict):
         return False
@@ -430,6 +1227,13 @@ def validate_comparison(comp: dict, existing_ids: set[str]) -> bool:
     return True
 
 
+def _string_list(value) -> list[str]:
+    """The non-empty string items of value when it is a list, else []."""
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, str) and item.strip()]
+
+
 def resolve_unit(
     unit_ref,
     existing_ids: set[str],
@@ -445,7 +1249,7 @@ def resolve_unit(
         if unit_ref in existing_ids or unit_ref in new_units_map:
             return unit_ref, None
         # Check against all ids/labels/aliases (case-insensitive)
-        canonical = terms_to_id.get(unit_ref.lower())
+        canonical = terms_to_id.get(unit_ref.casefold())
         if canonical:
             log.debug("Unknown unit id %r — matched existing unit %r via terms lookup", unit_ref, canonical)
             return canonical, None
@@ -459,89 +1263,199 @@ def resolve_unit(
     if isinstance(unit_ref, dict):
         # Before creating a new unit, check if label or any alias matches an existing unit
         check_terms = set()
-        if unit_ref.get("label"):
-            check_terms.add(unit_ref["label"].lower())
-        for alias in unit_ref.get("aliases", []):
-            check_terms.add(alias.lower())
+        for term in chain((unit_ref.get("label"),), _string_list(unit_ref.get("aliases"))):
+            if isinstance(term, str) and term:
+                check_terms.add(term.casefold())
         for term in check_terms:
             canonical = terms_to_id.get(term)
             if canonical:
-                log.debug("New unit %r — matched existing unit %r via label/alias", unit_ref.get("id"), canonical)
+                log.debug("New unit %r — matched unit %r via label/alias", unit_ref.get("id"), canonical)
                 return canonical, None
 
-        suggested_id = unit_ref.get("id") or slugify(unit_ref.get("label", "unknown"))
+        suggested_id = unit_ref.get("id") or unit_ref.get("label") or "unknown"
         # Ensure the id is valid snake_case
-        suggested_id = slugify(suggested_id)
+        suggested_id = slugify(str(suggested_id))
         # If already queued this run, reuse it (same article can reference a
         # new unit multiple times — don't create _2 duplicates)
         if suggested_id in new_units_map:
             return suggested_id, None
-        # Deduplicate against existing unit ids only
+        # Deduplicate against existing ids and the suffixed ids handed out this run
         final_id = suggested_id
         counter = 2
-        while final_id in existing_ids:
+        while final_id in existing_ids or final_id in new_units_map:
             final_id = f"{suggested_id}_{counter}"
             counter += 1
 
+        # Only well-typed fields reach units.json: the next run's startup
+        # (terms_to_id, the prompt table) reads them back as strings
+        label = unit_ref.get("label")
         new_unit = {
             "id": final_id,
-            "label": unit_ref.get("label", final_id.replace("_", " ").title()),
+            "label": label if isinstance(label, str) and label.strip()
+                     else final_id.replace("_", " ").title(),
         }
-        if unit_ref.get("emoji"):
+        if isinstance(unit_ref.get("emoji"), str) and unit_ref["emoji"]:
             new_unit["emoji"] = unit_ref["emoji"]
-        if unit_ref.get("aliases"):
-            new_unit["aliases"] = unit_ref["aliases"]
-        if unit_ref.get("tags"):
-            new_unit["tags"] = unit_ref["tags"]
+        for field in ("aliases", "tags"):
+            values = _string_list(unit_ref.get(field))
+            if values:
+                new_unit[field] = values
 
         new_units_map[final_id] = new_unit
+        # Register its terms so later proposals of the same unit — by label or
+        # alias, in this article or a later one — resolve to it directly
+        for term in chain((final_id, new_unit["label"]), new_unit.get("aliases", ())):
+            terms_to_id.setdefault(term.casefold(), final_id)
         return final_id, new_unit
 
     return None, None
 
 
-def process_article(
+async def fetch_phase(
+    client: httpx.AsyncClient,
     article_url: str,
     explicit_text: str,
     rss_summary: str,
+) -> str | None:
+    """Return the plain text to extract from, or None if nothing usable was found.
+
+    Network-bound and free of shared state, so many can run concurrently.
+    """
+    if explicit_text:
+        # --text flag: user supplied text directly, skip all HTTP fetching
+        text = html_to_text(explicit_text)
+        log.debug("  fetch: using explicit text (%d chars)", len(text))
+        return text
+
+    # Always try to fetch the full article first
+    text = await fetch_article_text(client, article_url)
+    if not text and rss_summary:
+        text = summary_fallback(rss_summary)
+    return text
+
+
+def summary_fallback(rss_summary: str) -> str:
+    """Last resort when the article page can't be fetched: the RSS summary as text
+    (usually just a headline, ~100-200 chars)."""
+    text = html_to_text(rss_summary)
+    log.debug("  fetch: HTTP failed, falling back to RSS summary (%d chars)", len(text))
+    return text
+
+
+def start_fetches(
+    client: httpx.AsyncClient,
+    jobs: list[tuple[str, str, str]],
+    limit: asyncio.Semaphore | None = None,
+) -> list[asyncio.Task]:
+    """Schedule fetch_phase for each (article_url, explicit_text, rss_summary) job.
+
+    At most ARTICLE_FETCH_WORKERS fetches are in flight (per call, or across
+    every call sharing `limit`); the returned tasks are in job order, so
+    awaiting them one by one lets extraction start on the first article while
+    the rest are still downloading.
+    """
+    limit = limit or asyncio.Semaphore(ARTICLE_FETCH_WORKERS)
+
+    async def bounded(job: tuple[str, str, str]) -> str | None:
+        async with limit:
+            return await fetch_phase(client, *job)
+
+    return [asyncio.ensure_future(bounded(job)) for job in jobs]
+
+
+async def fetch_many(
+    client: httpx.AsyncClient,
+    jobs: list[tuple[str, str, str]],
+) -> list[str | None]:
+    """Fetch every job concurrently and return the texts in job order."""
+    return await asyncio.gather(*start_fetches(client, jobs))
+
+
+def fetch_articles(jobs: list[tuple[str, str, str]]) -> list[str | None]:
+    """Blocking fetch_many for callers outside the event loop (--url mode)."""
+    async def run() -> list[str | None]:
+        async with http_client() as client:
+            return await fetch_many(client, jobs)
+
+    return asyncio.run(run())
+
+
+def wants_llm(article_url: str, text: str | None) -> bool:
+    """Return True if the fetched text is worth an LLM call."""
+    log.debug("--- %s", article_url)
+
+    if not text:
+        log.debug("  fetch: no text — skipping")
+        return False
+
+    # Cheap pre-filter: validate_comparison rejects any quote without one of the
+    # COMPARISON_KEYWORDS, and quotes must be verbatim from the article, so an
+    # article with no keyword anywhere can't yield an edge. Skipping it saves an
+    # LLM call (and rate-limit slot) for the ~80% of articles with nothing in them.
+    if not has_comparison_phrase(text):
+        log.debug("  pre-filter: no comparison phrase, skipping LLM")
+        return False
+    return True
+
+
+def extract_batch(
+    articles: list[tuple[str, str]],
     units: list[dict],
     existing_unit_ids: set[str],
     terms_to_id: dict[str, str],
     new_units_map: dict[str, dict],
     new_edges: list[dict],
-    dedup_edge_keys: set[tuple],
+    dedup_edge_keys: set[int],
     max_edge_num_ref: list[int],
     today: str,
     filter_both_new: bool = False,
-) -> None:
-    """Fetch, extract, validate and collect edges for a single article URL."""
-    log.debug("--- %s", article_url)
+) -> bool:
+    """Run one LLM request over (article_url, text) pairs, then collect each article's edges.
 
-    if explicit_text:
-        # --text flag: user supplied text directly, skip all HTTP fetching
-        text = BeautifulSoup(explicit_text, "html.parser").get_text(separator=" ", strip=True)
-        log.debug("  fetch: using explicit text (%d chars)", len(text))
-    else:
-        # Always try to fetch the full article first
-        text = fetch_article_text(article_url)
-        if not text and rss_summary:
-            # Last resort: RSS summary (usually just a headline, ~100-200 chars)
-            text = BeautifulSoup(rss_summary, "html.parser").get_text(separator=" ", strip=True)
-            log.debug("  fetch: HTTP failed, falling back to RSS summary (%d chars)", len(text))
-
-    if not text:
-        log.debug("  fetch: no text — skipping")
-        return
+    Returns False if any article got no answer (both LLMs failed), so the
+    caller knows those articles still need extracting on a later run.
+    Mutates the shared accumulators and paces LLM calls, so must run serially.
+    """
+    if not articles:
+        return True
+    log.debug("  llm: calling for %d article(s)...", len(articles))
+    results = call_llm_batch(articles, units_prompt_block(units, new_units_map))
+    answered = True
+    for article_url, _ in articles:
+        comparisons = results[article_url]
+        if comparisons is None:
+            answered = False
+            continue
+        collect_edges(
+            article_url, comparisons, existing_unit_ids, terms_to_id,
+            new_units_map, new_edges, dedup_edge_keys, max_edge_num_ref, today, filter_both_new,
+        )
+    return answered
 
-    log.debug("  llm: calling...")
-    all_units = units + list(new_units_map.values())
-    comparisons = call_llm(text, all_units)
 
+def collect_edges(
+    article_url: str,
+    comparisons: list[dict],
+    existing_unit_ids: set[str],
+    terms_to_id: dict[str, str],
+    new_units_map: dict[str, dict],
+    new_edges: list[dict],
+    dedup_edge_keys: set[int],
+    max_edge_num_ref: list[int],
+    today: str,
+    filter_both_new: bool,
+) -> None:
+    """Validate one article's comparisons and append the resulting edges."""
     if not comparisons:
-        log.debug("  llm: no comparisons found")
+        log.debug("  llm: no comparisons found in %s", article_url)
         return
 
-    log.debug("  llm: %d comparison(s) found", len(comparisons))
+    log.debug("  llm: %d comparison(s) found in %s", len(comparisons), article_url)
+
+    # Bound once: these run for every candidate comparison
+    is_duplicate = dedup_edge_keys.__contains__
+    remember_edge = dedup_edge_keys.add
+    append_edge = new_edges.append
 
     edges_this_article = 0
     for comp in comparisons:
@@ -549,7 +1463,7 @@ def process_article(
             log.debug("  Per-article cap reached (%d), stopping", MAX_EDGES_PER_ARTICLE)
             break
 
-        if not validate_comparison(comp, existing_unit_ids):
+        if not validate_comparison(comp):
             log.debug("  Invalid comparison: %r", comp)
             continue
 
@@ -571,16 +1485,16 @@ def process_article(
                 continue
 
         factor = float(comp["factor"])
-        edge_key = (from_id, to_id, factor, article_url)
-        if edge_key in dedup_edge_keys:
-            log.debug("  Duplicate edge: %s", edge_key)
+        edge_key = edge_hash(from_id, to_id, factor, article_url)
+        if is_duplicate(edge_key):
+            log.debug("  Duplicate edge: %s → %s ×%s (%s)", from_id, to_id, factor, article_url)
             continue
-        dedup_edge_keys.add(edge_key)
+        remember_edge(edge_key)
 
         max_edge_num_ref[0] += 1
         edge_id = f"e{max_edge_num_ref[0]:03d}"
 
-        new_edges.append({
+        append_edge({
             "id": edge_id,
             "from": from_id,
             "to": to_id,
@@ -593,10 +1507,213 @@ def process_article(
         edges_this_article += 1
 
 
+def process_article(article_url: str, explicit_text: str, rss_summary: str, **common) -> None:
+    """Fetch, extract, validate and collect edges for a single article URL."""
+    [text] = fetch_articles([(article_url, explicit_text, rss_summary)])
+    if wants_llm(article_url, text):
+        extract_batch([(article_url, text)], **common)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+async def run_feeds(
+    feed_urls: list[str],
+    args: argparse.Namespace,
+    existing_source_urls: set[str],
+    common: dict,
+) -> None:
+    """RSS mode: fetch every feed concurrently, then process entries feed by feed.
+
+    Feeds and articles are fetched on one AsyncClient for the whole run (at
+    most --fetch-workers feeds at a time); feed parsing is blocking, so it runs
+    on a thread pool via run_in_executor. Each feed's article fetches start as soon as it is parsed, so
+    feed parsing, article downloads and LLM extraction overlap. Feeds are
+    handled in completion order; LLM calls stay serial but run off the event
+    loop.
+    """
+    new_edges: list[dict] = common["new_edges"]
+    new_units_map: dict[str, dict] = common["new_units_map"]
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=max(1, min(args.fetch_workers, len(feed_urls))))
+    feed_limit = asyncio.Semaphore(max(1, args.fetch_workers))
+    fetch_limit = asyncio.Semaphore(max(1, args.article_workers))  # shared by every feed
+    fetches: list[asyncio.Task] = []  # every article fetch started, for cleanup
+
+    # Backfills (--max-age-hours 0) want the whole feed even if it hasn't changed
+    conditional = args.max_age_hours != 0
+
+    def select_entries(entries: list) -> tuple[list[tuple[str, str]], int, int]:
+        """Pick the (article_url, rss_summary) jobs worth fetching; count the skips."""
+        skipped_old = 0
+        skipped_dedup = 0
+        jobs: list[tuple[str, str]] = []
+        for entry in entries:
+            article_url = entry.get("link", "")
+            if not article_url:
+                continue
+            seen_key = canonical_url(article_url)
+            if seen_key in existing_source_urls:
+                skipped_dedup += 1
+                continue
+
+            # skip entries older than the age threshold
+            if not entry_is_recent(entry, args.max_age_hours):
+                log.debug("  skipping old entry: %s", article_url)
+                skipped_old += 1
+                continue
+
+            existing_source_urls.add(seen_key)
+            rss_summary = entry.get("summary") or entry.get("description") or ""
+            jobs.append((article_url, rss_summary))
+        return jobs, skipped_old, skipped_dedup
+
+    async def parse_feed(
+        url: str,
+        client: httpx.AsyncClient,
+    ) -> tuple[str, dict | None, Exception | None, dict]:
+        """Fetch and parse one feed, then start its article fetches straight away.
+
+        Starting fetches here rather than when the feed's turn comes means a
+        feed's articles download while earlier feeds are still being extracted.
+        """
+        validators = feed_validators(url) if conditional else {}
+        try:
+            async with feed_limit:
+                # Whole-request cutoff: httpx's timeout is per read, so a server
+                # trickling bytes could otherwise hold the feed open indefinitely
+                feed, content = await asyncio.wait_for(
+                    fetch_feed(client, url, validators), FEED_TIMEOUT,
+                )
+                if content:
+                    feed.update(await loop.run_in_executor(pool, parse_feed_content, content))
+        except Exception as exc:
+            return url, None, exc, {}
+        entries = feed.get("entries", [])
+        if feed.get("status") == 304 or not entries:
+            return url, feed, None, {}
+        truncated = bool(args.max_entries) and len(entries) > args.max_entries
+        if truncated:
+            entries = entries[:args.max_entries]
+        jobs, skipped_old, skipped_dedup = select_entries(entries)
+        # Summaries are applied by the consumer, which needs to see failed fetches
+        started = start_fetches(client, [(u, "", "") for u, _ in jobs], fetch_limit)
+        fetches.extend(started)
+        return url, feed, None, {
+            "entries": len(entries),
+            "truncated": truncated,
+            "jobs": jobs,
+            "fetches": started,
+            "skipped_old": skipped_old,
+            "skipped_dedup": skipped_dedup,
+        }
+
+    tasks: list[asyncio.Task] = []
+    try:
+        async with http_client() as client:
+            tasks = [asyncio.ensure_future(parse_feed(url, client)) for url in feed_urls]
+            for feed_idx, next_feed in enumerate(asyncio.as_completed(tasks), 1):
+                if _all_llms_exhausted():
+                    break  # pending fetches are cancelled below
+
+                feed_url, feed, error, prepared = await next_feed
+                log.info("Feed %d/%d: %s", feed_idx, len(feed_urls), feed_url)
+                if isinstance(error, (TimeoutError, httpx.TimeoutException)):
+                    log.warning("  feed timed out (limit %ds) — skipping", FEED_TIMEOUT)
+                    continue
+                if error is not None:
+                    log.warning("  feed error: %s", error)
+                    continue
+
+                if feed.get("status") == 304:
+                    log.info("  not modified since last run")
+                    continue
+
+                if not prepared:
+                    # No entries — three sub-cases:
+                    #  (a) HTTP error fetching the feed → skip entirely
+                    #  (b) a valid feed format was recognised but it's empty → skip
+                    #  (c) a 200 but no feed format → assume a direct article URL
+                    #      in feeds.txt (the original intent of this fallback)
+                    feed_status = feed.get("status", 0)
+                    if feed_status >= 400:
+                        log.warning("  HTTP %d — skipping", feed_status)
+                        continue
+                    if feed.get("version"):
+                        log.info("  empty feed")
+                        remember_feed_validators(feed_url, feed)
+                        continue
+                    # No recognised feed format: treat as a direct article URL
+                    log.debug("  no feed format detected — trying as direct article URL")
+                    complete = True
+                    if canonical_url(feed_url) not in existing_source_urls:
+                        existing_source_urls.add(canonical_url(feed_url))
+                        edges_before = len(new_edges)
+                        units_before = len(new_units_map)
+                        text = await fetch_phase(client, feed_url, "", "")
+                        complete = bool(text)
+                        if wants_llm(feed_url, text):
+                            complete = await asyncio.to_thread(
+                                extract_batch, [(feed_url, text)], **common
+                            )
+                        log.info("  direct article → +%d edges, +%d units",
+                                 len(new_edges) - edges_before, len(new_units_map) - units_before)
+                    else:
+                        log.info("  already seen")
+                    if complete and not _all_llms_exhausted():
+                        remember_feed_validators(feed_url, feed)
+                    continue
+
+                edges_before = len(new_edges)
+                units_before = len(new_units_map)
+                processed = 0
+                # Whether every entry was fully handled; only then may the next
+                # run's conditional GET (a 304) stand in for re-reading this feed
+                complete = not prepared["truncated"]
+
+                # Extract in entry order as the fetches complete, batched by
+                # LLMBatcher. The (blocking, rate-paced) LLM calls run in a worker
+                # thread so every other fetch keeps going.
+                batcher = LLMBatcher()
+                for (article_url, rss_summary), fetch in zip(prepared["jobs"], prepared["fetches"]):
+                    text = await fetch
+                    if _all_llms_exhausted():
+                        break
+                    processed += 1
+                    if not text:
+                        complete = False  # page unavailable this run; retry it next run
+                        if rss_summary:
+                            text = summary_fallback(rss_summary)
+                    if not wants_llm(article_url, text):
+                        continue
+                    batch = batcher.add(article_url, text)
+                    if batch:
+                        complete &= await asyncio.to_thread(extract_batch, batch, **common)
+                if not _all_llms_exhausted():
+                    # flush at the feed boundary
+                    complete &= await asyncio.to_thread(extract_batch, batcher.drain(), **common)
+                    # A failed batch isn't cached either; a 304 next run would hide its articles
+                    if complete:
+                        remember_feed_validators(feed_url, feed)
+
+                edges_added = len(new_edges) - edges_before
+                units_added = len(new_units_map) - units_before
+                skip_parts = []
+                if prepared["skipped_old"]:
+                    skip_parts.append(f"{prepared['skipped_old']} old")
+                if prepared["skipped_dedup"]:
+                    skip_parts.append(f"{prepared['skipped_dedup']} seen")
+                skip_str = (", " + ", ".join(skip_parts)) if skip_parts else ""
+                log.info("  %d entries | %d processed%s | +%d edges, +%d units",
+                         prepared["entries"], processed, skip_str, edges_added, units_added)
+    finally:
+        # Drop any feeds or articles not yet fetched (e.g. both LLMs exhausted mid-run)
+        for task in chain(tasks, fetches):
+            task.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Anything But Metric scraper")
     parser.add_argument("--url", default=None,
@@ -608,6 +1725,12 @@ def main() -> None:
                         help="Limit number of feeds processed (useful for testing)")
     parser.add_argument("--max-entries", type=int, default=None,
                         help="Limit entries processed per feed (useful for testing)")
+    parser.add_argument("--fetch-workers", type=int, default=DEFAULT_FEED_WORKERS,
+                        help="Number of RSS feeds fetched concurrently. "
+                             f"Default: {DEFAULT_FEED_WORKERS}")
+    parser.add_argument("--article-workers", type=int, default=ARTICLE_FETCH_WORKERS,
+                        help="Number of article pages fetched concurrently in RSS mode. "
+                             f"Default: {ARTICLE_FETCH_WORKERS}")
     parser.add_argument("--filter-both-new", action="store_true", default=False,
                         help="Reject edges where both from and to are new units created this run. "
                              "Useful once the unit catalogue is large; off by default.")
@@ -615,6 +1738,11 @@ def main() -> None:
                         help="Skip RSS entries older than this many hours (0 = no filter, "
                              "useful when adding a new feed to backfill history). "
                              f"Default: {DEFAULT_MAX_AGE_HOURS}")
+    parser.add_argument("--no-cache", action="store_true", default=False,
+                        help="Bypass the on-disk article-text, LLM-answer and feed ETag cache")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, metavar="DIR",
+                        help="Directory for that cache. "
+                             f"Default: {CACHE_DIR.relative_to(REPO_ROOT)}")
     parser.add_argument("-v", "--verbose", action="store_true", default=False,
                         help="Show detailed per-article fetch/LLM logs (debug output)")
     parser.add_argument(
@@ -631,36 +1759,44 @@ def main() -> None:
     if args.verbose or args.url:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    global _cache
+    if not args.no_cache:
+        _cache = diskcache.Cache(args.cache_dir, size_limit=CACHE_SIZE_LIMIT)
+        _cache.expire()  # drop entries past their TTL before the dir is re-saved by CI
+
     # 1. Load existing data
     units: list[dict] = load_json(UNITS_FILE)
     edges: list[dict] = load_json(EDGES_FILE)
     log.info("Loaded %d units, %d edges", len(units), len(edges))
 
     existing_unit_ids: set[str] = {u["id"] for u in units}
-    existing_source_urls: set[str] = {e["source_url"] for e in edges}
 
-    # Build a lookup: every lowercased id/label/alias → canonical unit id
+    # Build a lookup: every casefolded id/label/alias → canonical unit id
     # Used to match LLM output that uses a label or alias instead of the exact id
-    terms_to_id: dict[str, str] = {}
-    for u in units:
-        terms_to_id[u["id"].lower()] = u["id"]
-        terms_to_id[u["label"].lower()] = u["id"]
-        for alias in u.get("aliases", []):
-            terms_to_id[alias.lower()] = u["id"]
+    terms_to_id: dict[str, str] = {
+        term.casefold(): u["id"]
+        for u in units
+        for term in chain((u["id"], u.get("label")), _string_list(u.get("aliases")))
+        if isinstance(term, str)
+    }
 
-    # Find max numeric edge ID (IDs look like "e004")
-    max_edge_num_ref = [0]
+    # One pass over the existing edges: seen source URLs (canonicalised), dedup keys,
+    # and the max numeric edge ID (IDs look like "e004")
+    existing_source_urls: set[str] = set()
+    dedup_edge_keys: set[int] = set()
+    max_edge_num = 0
     for e in edges:
-        m = re.match(r"e(\d+)$", e.get("id", ""))
-        if m:
-            max_edge_num_ref[0] = max(max_edge_num_ref[0], int(m.group(1)))
+        fields = edge_key_fields(e)
+        existing_source_urls.add(canonical_url(fields[3]))
+        dedup_edge_keys.add(edge_hash(*fields))
+        eid = e.get("id", "")
+        if eid[:1] == "e" and eid[1:].isdecimal():  # same strings as r"e(\d+)$", no regex per edge
+            max_edge_num = max(max_edge_num, int(eid[1:]))
+    max_edge_num_ref = [max_edge_num]
 
     # Accumulators
     new_units_map: dict[str, dict] = {}
     new_edges: list[dict] = []
-    dedup_edge_keys: set[tuple] = {
-        (e["from"], e["to"], e["factor"], e["source_url"]) for e in edges
-    }
 
     today = date.today().isoformat()
 
@@ -686,7 +1822,7 @@ def main() -> None:
 
         # Fetch text up-front when caller wants a dump (avoids fetching twice)
         if args.dump_text_to and not supplied_text:
-            fetched = fetch_article_text(args.url)
+            [fetched] = fetch_articles([(args.url, "", "")])
             if fetched:
                 Path(args.dump_text_to).write_text(fetched, encoding="utf-8")
                 log.info("Wrote article text (%d chars) to %s", len(fetched), args.dump_text_to)
@@ -710,86 +1846,7 @@ def main() -> None:
             feed_urls = feed_urls[:args.max_feeds]
         log.info("Processing %d feeds", len(feed_urls))
 
-        for feed_idx, feed_url in enumerate(feed_urls, 1):
-            if _all_llms_exhausted():
-                break
-
-            log.info("Feed %d/%d: %s", feed_idx, len(feed_urls), feed_url)
-            try:
-                feed = feedparser.parse(feed_url)
-            except Exception as exc:
-                log.warning("  feedparser error: %s", exc)
-                continue
-
-            entries = feed.get("entries", [])
-
-            if not entries:
-                # feedparser got no entries — three sub-cases:
-                #  (a) HTTP error fetching the feed → skip entirely
-                #  (b) feedparser recognised a valid feed format but it's empty → skip
-                #  (c) feedparser got a 200 but no feed format → assume a direct article URL
-                #      in feeds.txt (the original intent of this fallback)
-                feed_status = feed.get("status", 0)
-                if feed_status >= 400:
-                    log.warning("  HTTP %d — skipping", feed_status)
-                    continue
-                if feed.get("version"):
-                    log.info("  empty feed")
-                    continue
-                # No recognised feed format: treat as a direct article URL
-                log.debug("  no feed format detected — trying as direct article URL")
-                if feed_url not in existing_source_urls:
-                    existing_source_urls.add(feed_url)
-                    edges_before = len(new_edges)
-                    units_before = len(new_units_map)
-                    process_article(feed_url, explicit_text="", rss_summary="", **common)
-                    log.info("  direct article → +%d edges, +%d units",
-                             len(new_edges) - edges_before, len(new_units_map) - units_before)
-                else:
-                    log.info("  already seen")
-                continue
-
-            if args.max_entries:
-                entries = entries[:args.max_entries]
-
-            edges_before = len(new_edges)
-            units_before = len(new_units_map)
-            skipped_old = 0
-            skipped_dedup = 0
-            processed = 0
-
-            for entry in entries:
-                if _all_llms_exhausted():
-                    break
-
-                article_url = entry.get("link", "")
-                if not article_url:
-                    continue
-                if article_url in existing_source_urls:
-                    skipped_dedup += 1
-                    continue
-
-                # skip entries older than the age threshold
-                if not entry_is_recent(entry, args.max_age_hours):
-                    log.debug("  skipping old entry: %s", article_url)
-                    skipped_old += 1
-                    continue
-
-                existing_source_urls.add(article_url)
-                processed += 1
-                rss_summary = entry.get("summary") or entry.get("description") or ""
-                process_article(article_url, explicit_text="", rss_summary=rss_summary, **common)
-
-            edges_added = len(new_edges) - edges_before
-            units_added = len(new_units_map) - units_before
-            skip_parts = []
-            if skipped_old:
-                skip_parts.append(f"{skipped_old} old")
-            if skipped_dedup:
-                skip_parts.append(f"{skipped_dedup} seen")
-            skip_str = (", " + ", ".join(skip_parts)) if skip_parts else ""
-            log.info("  %d entries | %d processed%s | +%d edges, +%d units",
-                     len(entries), processed, skip_str, edges_added, units_added)
+        asyncio.run(run_feeds(feed_urls, args, existing_source_urls, common))
 
     # 4. Write results
     n_new_units = len(new_units_map)
@@ -804,13 +1861,14 @@ def main() -> None:
 
     if n_new_units > 0 or n_new_edges > 0:
         if n_new_units > 0:
-            units.extend(new_units_map.values())
-            save_json(UNITS_FILE, units)
+            append_json(UNITS_FILE, list(new_units_map.values()))
         if n_new_edges > 0:
-            edges.extend(new_edges)
-            save_json(EDGES_FILE, edges)
+            append_json(EDGES_FILE, new_edges)
+
+    if _cache is not None:
+        _cache.close()
 
-    print(f"NEW_EDGES={n_new_edges}")
+    emit_new_edges(n_new_edges)
 
 
 if __name__ == "__main__":
@@ -818,5 +1876,5 @@ if __name__ == "__main__":
         main()
     except Exception as exc:
         log.exception("Unhandled error: %s", exc)
-        print("NEW_EDGES=0")
+        emit_new_edges(0)
         sys.exit(0)